@@ -11,42 +11,101 @@ testing environment: Raspberry Pi Zero W
 
 import time
 import board
-import adafruit_dht
-import csv
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 import signal
 import sys
 import logging
+import logging.handlers
+import queue
+import threading
 
-# Configure logging
+# shared helpers (dht_common.py lives at the repo root, one level up)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import dht_common
+
+# Configure logging. The sampling thread only enqueues LogRecords; a
+# background QueueListener thread does the slow file/stderr writes, so
+# an SD card stall during logging can never delay a sensor read.
+log_q = queue.Queue(-1)
+_log_fmt = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_file_handler = logging.FileHandler('dht11_sensor.log')
+_file_handler.setFormatter(_log_fmt)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_log_fmt)
+log_listener = logging.handlers.QueueListener(
+    log_q, _file_handler, _stream_handler, respect_handler_level=True
+)
+log_listener.start()
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('dht11_sensor.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[logging.handlers.QueueHandler(log_q)]
 )
 logger = logging.getLogger(__name__)
 
+# Celsius -> Fahrenheit scale factor (shared constant, bound locally so
+# the conversion stays a single multiply per reading)
+C_TO_F_SCALE = dht_common.C_TO_F_SCALE
+
+
+class _PigpioDHT11:
+    """DHT11 backend that reads through the pigpio daemon
+
+    The pure-Python adafruit_dht bit-bang loop is right at the edge of
+    the DHT11's 50 us bit timing on the 1 GHz single-core Pi Zero W,
+    which is where most of the RuntimeErrors come from. pigpiod samples
+    the GPIO line in a separate C daemon (DMA-assisted), so reads are
+    both cheaper and far more reliable. Exposes the same
+    measure()/_temperature/_humidity/exit() surface the logger uses on
+    the adafruit_dht object.
+
+    Requires the pigpio daemon to be running and the pigpio-dht package
+    (pip install pigpio-dht).
+    """
+
+    def __init__(self, bcm_pin):
+        from pigpio_dht import DHT11 as PigpioDHT11
+        self._sensor = PigpioDHT11(bcm_pin)
+        self._temperature = None
+        self._humidity = None
+
+    def measure(self):
+        result = self._sensor.read()
+        if not result.get('valid'):
+            raise RuntimeError("DHT11 checksum failed (pigpio backend)")
+        self._temperature = result['temp_c']
+        self._humidity = result['humidity']
+
+    def exit(self):
+        # pigpio_dht cleans up its own daemon connection
+        pass
+
 
 class DHT11SensorLogger:
     """Class to handle DHT11 sensor data recording"""
     
-    def __init__(self, gpio_pin=board.D4, data_dir="sensor_data"):
+    def __init__(self, gpio_pin=board.D4, data_dir="sensor_data", batch_size=20):
         """
         Initialize the DHT11 sensor logger
-        
+
         Args:
             gpio_pin: GPIO pin where DHT11 data pin is connected (default: GPIO4/Pin 7)
             data_dir: Directory to store data files
+            batch_size: Number of readings to buffer before writing to disk
         """
-        self.sensor = adafruit_dht.DHT11(gpio_pin)
+        self.sensor = self._create_sensor(gpio_pin)
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
-        self.running = True
+        # Single shutdown primitive: set from the signal handler, polled
+        # by the loop, and doubles as an interruptible sleep
+        self._stop = threading.Event()
+        self.batch_size = batch_size
+        self._batch = []
+        # Bound once so each reading pays one call, not an attribute
+        # lookup plus a call - measurable on a Pi Zero W
+        self._now = datetime.now
         
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self.signal_handler)
@@ -55,26 +114,72 @@ class DHT11SensorLogger:
         # Generate filenames with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.csv_file = self.data_dir / f"dht11_data_{timestamp}.csv"
-        self.json_file = self.data_dir / f"dht11_data_{timestamp}.json"
+        self.json_file = self.data_dir / f"dht11_data_{timestamp}.jsonl"
+        self.json_fh = None  # opened on first save_to_json call
+        # Cache plain-string paths once; passing the Path objects to
+        # open()/os.open() re-runs __fspath__ on every call
+        self._csv_path = os.fspath(self.csv_file)
+        self._json_path = os.fspath(self.json_file)
+
+        # Running aggregates so get_statistics() is O(1) instead of
+        # re-parsing the whole CSV every time
+        self._readings = 0
+        self._temp_min = float('inf')
+        self._temp_max = float('-inf')
+        self._temp_sum = 0.0
+        self._hum_min = float('inf')
+        self._hum_max = float('-inf')
+        self._hum_sum = 0.0
         
         # Initialize CSV file with headers
         self._init_csv_file()
-        
+
+        # Background writer thread owns the file handles; SD card writes
+        # can stall for up to ~1 s during journal flushes and must not
+        # delay the timing-sensitive DHT reads
+        self._q = queue.Queue(maxsize=1024)
+        self._writer_thr = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thr.start()
+
         logger.info(f"DHT11 Sensor Logger initialized on pin {gpio_pin}")
         logger.info(f"Data will be saved to {self.data_dir}")
     
+    def _create_sensor(self, gpio_pin):
+        """Create the DHT11 backend, preferring pigpio when available
+
+        Falls back to the pure-Python adafruit_dht driver if pigpio (or
+        its daemon) is not installed, so the script keeps working on an
+        unmodified system.
+        """
+        try:
+            sensor = _PigpioDHT11(gpio_pin.id)
+            logger.info("Using pigpio DHT11 backend (C daemon timing)")
+            return sensor
+        except Exception as e:
+            logger.info(f"pigpio backend unavailable ({e}), using adafruit_dht")
+            # use_pulseio=True: this script targets bookworm, where the
+            # pulseio backend still works (see note at the top)
+            return dht_common.get_sensor(gpio_pin.id, "DHT11", use_pulseio=True)
+
     def signal_handler(self, sig, frame):
         """Handle shutdown signals gracefully"""
         logger.info("Shutdown signal received. Cleaning up...")
-        self.running = False
-        self.cleanup()
-        sys.exit(0)
+        # Setting the event cuts any in-progress wait() short, so a
+        # SIGTERM mid-sleep no longer has to ride out the interval;
+        # run() exits its loop and does the cleanup
+        self._stop.set()
     
     def _init_csv_file(self):
-        """Initialize CSV file with headers"""
-        with open(self.csv_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['timestamp', 'temperature_c', 'temperature_f', 'humidity_percent'])
+        """Initialize CSV file with headers and a persistent descriptor
+
+        The schema is a fixed four columns of ISO timestamp + numbers -
+        nothing that ever needs quoting - so rows are pre-formatted as
+        text and pushed through raw os.write, skipping csv.writer's
+        per-field quoting inspection. Each batch flush is then a single
+        write(2) syscall.
+        """
+        self._csv_fd = os.open(self._csv_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        os.write(self._csv_fd, b"timestamp,temperature_c,temperature_f,humidity_percent\n")
         logger.info(f"CSV file created: {self.csv_file}")
     
     def read_sensor(self):
@@ -85,20 +190,37 @@ class DHT11SensorLogger:
             dict: Sensor data or None if read failed
         """
         try:
-            temperature_c = self.sensor.temperature
-            humidity = self.sensor.humidity
+            # A single measure() is one bit-banged transaction; reading
+            # the temperature and humidity properties separately can
+            # trigger two timing-sensitive reads per sample
+            self.sensor.measure()
+            temperature_c = self.sensor._temperature
+            humidity = self.sensor._humidity
             
             if temperature_c is not None and humidity is not None:
-                temperature_f = temperature_c * 9.0 / 5.0 + 32.0
+                temperature_f = temperature_c * C_TO_F_SCALE + 32.0
                 
                 data = {
-                    'timestamp': datetime.now().isoformat(),
+                    # timespec='seconds' is a shorter, faster formatter
+                    # and sub-second precision is noise at a 2 s cadence
+                    'timestamp': self._now().isoformat(timespec='seconds'),
                     'temperature_c': round(temperature_c, 1),
                     'temperature_f': round(temperature_f, 1),
                     'humidity_percent': round(humidity, 1)
                 }
-                
-                logger.debug(f"Sensor read successful: Temp={temperature_c}°C, Humidity={humidity}%")
+
+                # Update running aggregates for get_statistics()
+                self._readings += 1
+                self._temp_min = min(self._temp_min, temperature_c)
+                self._temp_max = max(self._temp_max, temperature_c)
+                self._temp_sum += temperature_c
+                self._hum_min = min(self._hum_min, humidity)
+                self._hum_max = max(self._hum_max, humidity)
+                self._hum_sum += humidity
+
+                # %-style args are only formatted if DEBUG is enabled,
+                # so the default INFO level pays nothing here
+                logger.debug("Sensor read successful: Temp=%s°C, Humidity=%s%%", temperature_c, humidity)
                 return data
             else:
                 logger.warning("Sensor returned None values")
@@ -106,47 +228,78 @@ class DHT11SensorLogger:
                 
         except RuntimeError as e:
             # DHT sensors can be finicky, errors are expected occasionally
-            logger.debug(f"Sensor read error (expected occasionally): {e}")
+            logger.debug("Sensor read error (expected occasionally): %s", e)
             return None
         except Exception as e:
             logger.error(f"Unexpected error reading sensor: {e}")
             return None
     
     def save_to_csv(self, data):
-        """Save sensor data to CSV file"""
+        """Queue sensor data for the background CSV writer"""
         try:
-            with open(self.csv_file, 'a', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    data['timestamp'],
-                    data['temperature_c'],
-                    data['temperature_f'],
-                    data['humidity_percent']
-                ])
-            logger.debug("Data saved to CSV")
+            self._q.put_nowait(('csv', data))
+        except queue.Full:
+            logger.error("Writer queue full, dropping CSV record")
+
+    def _writer_loop(self):
+        """Background thread that performs all data-file writes
+
+        Pulls records off the queue, batches CSV rows, and appends JSONL
+        records, so the sampling thread only pays for a queue put.
+        A None sentinel (sent from cleanup) flushes and exits.
+        """
+        while True:
+            record = self._q.get()
+            if record is None:
+                break
+            kind, data = record
+            try:
+                if kind == 'csv':
+                    # One writerows + fsync per batch_size readings
+                    # instead of a write per reading - reduces SD card
+                    # write-amplification
+                    self._batch.append(
+                        f"{data['timestamp']},{data['temperature_c']},"
+                        f"{data['temperature_f']},{data['humidity_percent']}\n"
+                    )
+                    if len(self._batch) >= self.batch_size:
+                        self._flush_csv_batch()
+                elif kind == 'json':
+                    self._write_json_record(data)
+            except Exception as e:
+                logger.error(f"Error writing {kind} record: {e}")
+        # Flush any partial batch before the thread exits
+        try:
+            self._flush_csv_batch()
         except Exception as e:
-            logger.error(f"Error saving to CSV: {e}")
+            logger.error(f"Error flushing final batch: {e}")
+
+    def _flush_csv_batch(self):
+        """Write any buffered CSV rows to disk in a single batch"""
+        if not self._batch:
+            return
+        os.write(self._csv_fd, "".join(self._batch).encode())
+        os.fsync(self._csv_fd)
+        self._batch.clear()
     
     def save_to_json(self, data):
-        """Save sensor data to JSON file"""
+        """Queue sensor data for the background JSONL writer"""
         try:
-            # Read existing data if file exists
-            if self.json_file.exists():
-                with open(self.json_file, 'r') as f:
-                    json_data = json.load(f)
-            else:
-                json_data = []
-            
-            # Append new data
-            json_data.append(data)
-            
-            # Write updated data
-            with open(self.json_file, 'w') as f:
-                json.dump(json_data, f, indent=2)
-            
-            logger.debug("Data saved to JSON")
-        except Exception as e:
-            logger.error(f"Error saving to JSON: {e}")
+            self._q.put_nowait(('json', data))
+        except queue.Full:
+            logger.error("Writer queue full, dropping JSON record")
+
+    def _write_json_record(self, data):
+        """Append one record to the JSON Lines file (writer thread only)
+
+        Newline-delimited JSON: one record per line, append-only.
+        Rewriting the whole array every reading was O(N^2) I/O and
+        held the full history in RAM - noticeable on a Pi Zero W.
+        """
+        if self.json_fh is None:
+            self.json_fh = open(self._json_path, 'a', buffering=8192)
+        self.json_fh.write(json.dumps(data, separators=(",", ":")) + "\n")
+        logger.debug("Data saved to JSON")
     
     def display_data(self, data):
         """Display sensor data in console"""
@@ -157,36 +310,25 @@ class DHT11SensorLogger:
         print("="*50)
     
     def get_statistics(self):
-        """Calculate and return statistics from collected data"""
+        """Return statistics from the running aggregates (no file I/O)"""
         try:
-            data_points = []
-            with open(self.csv_file, 'r') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    data_points.append({
-                        'temperature_c': float(row['temperature_c']),
-                        'humidity_percent': float(row['humidity_percent'])
-                    })
-            
-            if data_points:
-                temps = [d['temperature_c'] for d in data_points]
-                humidities = [d['humidity_percent'] for d in data_points]
-                
-                stats = {
-                    'readings_count': len(data_points),
-                    'temperature': {
-                        'min': min(temps),
-                        'max': max(temps),
-                        'avg': sum(temps) / len(temps)
-                    },
-                    'humidity': {
-                        'min': min(humidities),
-                        'max': max(humidities),
-                        'avg': sum(humidities) / len(humidities)
-                    }
+            if self._readings == 0:
+                return None
+
+            stats = {
+                'readings_count': self._readings,
+                'temperature': {
+                    'min': self._temp_min,
+                    'max': self._temp_max,
+                    'avg': self._temp_sum / self._readings
+                },
+                'humidity': {
+                    'min': self._hum_min,
+                    'max': self._hum_max,
+                    'avg': self._hum_sum / self._readings
                 }
-                return stats
-            return None
+            }
+            return stats
         except Exception as e:
             logger.error(f"Error calculating statistics: {e}")
             return None
@@ -207,8 +349,13 @@ class DHT11SensorLogger:
         consecutive_errors = 0
         max_consecutive_errors = 10
         readings_count = 0
-        
-        while self.running:
+
+        # Deadline for the next reading - sleeping for the remaining time
+        # instead of the full interval keeps the cadence uniform despite
+        # variable sensor-read latency
+        next_t = time.monotonic()
+
+        while not self._stop.is_set():
             try:
                 # Read sensor
                 data = self.read_sensor()
@@ -240,20 +387,50 @@ class DHT11SensorLogger:
                         logger.error(f"Too many consecutive errors ({max_consecutive_errors}). Check sensor connection!")
                         consecutive_errors = 0  # Reset counter but continue trying
                 
-                # Wait before next reading
-                time.sleep(interval)
-                
+                # Wait until the next deadline (drift-corrected); the
+                # stop event doubles as an interruptible sleep
+                next_t += interval
+                dt = next_t - time.monotonic()
+                if dt > 0:
+                    if self._stop.wait(dt):
+                        break
+                else:
+                    next_t = time.monotonic()  # we fell behind, resync
+
             except KeyboardInterrupt:
                 logger.info("Keyboard interrupt received")
-                self.running = False
+                self._stop.set()
             except Exception as e:
                 logger.error(f"Unexpected error in main loop: {e}")
-                time.sleep(interval)
+                next_t += interval
+                dt = next_t - time.monotonic()
+                if dt > 0:
+                    if self._stop.wait(dt):
+                        break
+                else:
+                    next_t = time.monotonic()
+
+        # Loop exited (stop event or keyboard interrupt)
+        self.cleanup()
     
     def cleanup(self):
         """Cleanup resources"""
         try:
+            # Stop the writer thread; the sentinel makes it flush any
+            # partial batch before exiting, so no readings are lost
+            self._q.put(None)
+            self._writer_thr.join(timeout=5.0)
             self.sensor.exit()
+            if self._writer_thr.is_alive():
+                # The writer is still blocked on a stalled SD write;
+                # closing the descriptors under it risks EBADF or a
+                # write landing on a reused fd, so leave them for the
+                # OS to reclaim at process exit
+                logger.warning("Writer thread still busy; leaving data files open")
+            else:
+                os.close(self._csv_fd)
+                if self.json_fh is not None:
+                    self.json_fh.close()
             logger.info("Sensor cleanup completed")
             
             # Print final statistics
@@ -267,6 +444,10 @@ class DHT11SensorLogger:
                 logger.info(f"  Average humidity: {stats['humidity']['avg']:.1f}%")
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
+        finally:
+            # Drain and stop the logging listener last so the final
+            # statistics above still make it to disk
+            log_listener.stop()
 
 
 def main():
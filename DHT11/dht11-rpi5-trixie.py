@@ -10,18 +10,24 @@ testing environment: Raspberry Pi 5
 # core libraries
 import time
 import board
-import adafruit_dht
 import sys
 
 # new imports
 from datetime import datetime
+import atexit
 import os
 import subprocess
 import signal
 import logging
+import logging.handlers
+import queue
 import csv
 import json
 
+# shared helpers (dht_common.py lives at the repo root, one level up)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import dht_common
+
 # --- Configuration ---
 # The GPIO pin number the DHT11 data pin is connected to.
 # This uses the board numbering scheme (e.g., board.D4 is GPIO4).
@@ -30,12 +36,13 @@ import json
 DHT_PIN = board.D4 # GPIO pin 7 on Raspberry Pi 5
 
 # --- Initialization ---
-# Initialize the DHT sensor.
-# For a DHT22 sensor, you would use adafruit_dht.DHT22.
-# The 'use_pulseio=False' is important for Raspberry Pi 5 with libgpiod.
+# Get the (cached) DHT sensor from the shared helper module.
+# For a DHT22 sensor, you would pass kind="DHT22".
+# use_pulseio=False (the helper's default) is important for
+# Raspberry Pi 5 with libgpiod.
 
 try:
-    dht_sensor = adafruit_dht.DHT11(DHT_PIN, use_pulseio=False)
+    dht_sensor = dht_common.get_sensor(DHT_PIN.id, "DHT11")
 except ImportError:
     print("Error: A required library is not installed.")
     print("Please run: pip install adafruit-circuitpython-dht")
@@ -46,13 +53,22 @@ except Exception as e:
 
 # --- Logging (WIP) ---
 
+# Handlers sit behind a QueueListener thread so log I/O (file + stderr)
+# never runs on the thread doing the timing-sensitive sensor reads.
+log_q = queue.Queue(-1)
+_log_fmt = logging.Formatter('%(asctime)s - %(message)s')
+_file_handler = logging.FileHandler("dht11_sensor.log")
+_file_handler.setFormatter(_log_fmt)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_log_fmt)
+log_listener = logging.handlers.QueueListener(
+    log_q, _file_handler, _stream_handler, respect_handler_level=True
+)
+log_listener.start()
+atexit.register(log_listener.stop)  # flush pending records on exit
 logging.basicConfig(
-    level=logging.INFO, 
-    format='%(asctime)s - %(message)s',
-    handlers=[
-        logging.FileHandler("dht11_sensor.log"),
-        logging.StreamHandler()
-    ]
+    level=logging.INFO,
+    handlers=[logging.handlers.QueueHandler(log_q)]
 )
 logger = logging.getLogger(__name__)
 
@@ -61,35 +77,52 @@ logger = logging.getLogger(__name__)
 print("Sensor initialized. Starting readings...")
 print("Press Ctrl+C to exit.")
 
-while True:
-    try:
-        # Attempt to read from the sensor
-        temperature_c = dht_sensor.temperature
-        humidity = dht_sensor.humidity
+# Time delay between readings (minimum 2 seconds for DHT11)
+# Set to 3 seconds for more consistent results
+SAMPLE_INTERVAL = 3.0
+
+# Deadline for the next reading - sleeping for the remaining time instead
+# of a fixed 3.0 s keeps the cadence uniform even though a DHT read can
+# take anywhere from 200 ms to a second.
+next_t = time.monotonic()
 
-        if humidity is not None and temperature_c is not None:
-            temperature_f = temperature_c * (9 / 5) + 32
-            print(f"{datetime.now()} - ", end="")
-            print(f"Temperature: {temperature_c:.1f}°C ({temperature_f:.1f}°F) | Humidity: {humidity}%")
+# The outer try covers the drift-corrected sleep too, so Ctrl+C during
+# the wait (most of every cycle) still exits cleanly.
+try:
+    while True:
+        try:
+            # Read the sensor via the shared helper: one measure()
+            # transaction, F conversion, and timestamp in a single call
+            temperature_c, temperature_f, humidity, timestamp = dht_common.read_dht(dht_sensor)
+
+            if humidity is not None and temperature_c is not None:
+                # One print per reading - two print() calls meant two stdout
+                # write syscalls per line
+                print(f"{timestamp} - Temperature: {temperature_c:.1f}°C ({temperature_f:.1f}°F) | Humidity: {humidity}%")
+            else:
+                print("Failed to retrieve data from sensor. Retrying...")
+
+        except RuntimeError as error:
+            # Errors happen fairly often with DHT sensors due to timing.
+            # This is a normal part of their operation.
+            print(f"Sensor reading failed: {error.args[0]}. Retrying...")
+        except Exception as error:
+            # Handle other potential errors and perform a clean exit.
+            dht_sensor.exit()
+            raise error
+
+        # Sleep until the next deadline (drift-corrected)
+        next_t += SAMPLE_INTERVAL
+        dt = next_t - time.monotonic()
+        if dt > 0:
+            time.sleep(dt)
         else:
-            print("Failed to retrieve data from sensor. Retrying...")
-
-    # Time delay between readings (minimum 2 seconds for DHT11)
-    # Set to 3 seconds for more consistent results
-        time.sleep(3.0)
-
-    except RuntimeError as error:
-        # Errors happen fairly often with DHT sensors due to timing.
-        # This is a normal part of their operation.
-        print(f"Sensor reading failed: {error.args[0]}. Retrying...")
-    except Exception as error:
-        # Handle other potential errors and perform a clean exit.
-        dht_sensor.exit()
-        raise error
-    except KeyboardInterrupt:
-        print("")
-        dht_sensor.exit()
-        sys.exit(0)
+            next_t = time.monotonic()  # we fell behind, resync
+
+except KeyboardInterrupt:
+    print("")
+    dht_sensor.exit()
+    sys.exit(0)
 
     
 
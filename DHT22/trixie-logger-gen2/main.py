@@ -8,11 +8,15 @@ testing environment: Raspberry Pi 5
 
 import time
 import board
-import adafruit_dht
 import csv
 import os
+import sys
 from datetime import datetime
 
+# shared helpers (dht_common.py lives at the repo root, two levels up)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import dht_common
+
 # --- Configuration ---
 # The GPIO pin connected to the DHT22 data pin.
 # board.D4 corresponds to GPIO4.
@@ -24,6 +28,11 @@ SAMPLE_INTERVAL = 3
 # The name of the CSV file to log data to.
 LOG_BASENAME = "dht22.csv"
 
+# Number of readings to buffer in memory before writing them to the SD
+# card in one go. 20 readings at a 3 s interval = one disk write per
+# minute instead of one per reading, which is much kinder to SD cards.
+BATCH_SIZE = 20
+
 # --- Main Script ---
 def main():
     """
@@ -47,11 +56,11 @@ def main():
         print(f"Error generating timestamp for log file: {e}")
         return
 
-    # Initialize the DHT22 sensor object.
-    # The 'use_pulseio=False' argument is crucial for modern Raspberry Pi OS
-    # and ensures it uses the digitalio backend.
+    # Get the (cached) DHT22 sensor object from the shared helper module.
+    # The helper's use_pulseio=False default is crucial for modern
+    # Raspberry Pi OS and ensures it uses the digitalio backend.
     try:
-        dht_sensor = adafruit_dht.DHT22(SENSOR_PIN, use_pulseio=False)
+        dht_sensor = dht_common.get_sensor(SENSOR_PIN.id, "DHT22")
     except ValueError as ve:
         print(f"Error: Could not initialize sensor. Is it connected to GPIO{SENSOR_PIN.id}?")
         print(f"Details: {ve}")
@@ -80,25 +89,46 @@ def main():
         print(f"Details: {e}")
         return
 
+    # --- NEW: Keep one file handle (and writer) open for the whole run ---
+    # Re-opening the file every 3 seconds cost an open/close syscall pair
+    # plus a fresh csv.writer per reading for no benefit.
+    try:
+        file = open(CSV_DIR_FILE_PATH, mode='a', newline='')
+        writer = csv.writer(file)
+    except IOError as e:
+        print(f"Error: Could not open log file for appending.")
+        print(f"Details: {e}")
+        return
+
+    # --- NEW: Batch rows in memory and flush every BATCH_SIZE readings ---
+    batch = []
+
+    def flush_batch():
+        if batch:
+            writer.writerows(batch)
+            file.flush()
+            os.fsync(file.fileno())
+            batch.clear()
+
     print("")
     print("--- Starting Temperature & Humidity Logging ---")
     print("Press Ctrl+C to stop.")
     print("")
 
+    # Deadline for the next reading - sleeping for the remaining time
+    # instead of a fixed interval keeps the cadence uniform even though
+    # a DHT read can take anywhere from 200 ms to a second.
+    next_t = time.monotonic()
+
     try:
         while True:
             try:
-                # Read temperature and humidity from the sensor
-                temperature_c = dht_sensor.temperature
-                humidity = dht_sensor.humidity
-
-                # Added Fahrenheit after the fact (Gemini can't u see the muricans DO NOT RESPECT CELSIUS LMAO)
-                temperature_f = temperature_c * 9 / 5 + 32 if temperature_c is not None else None
+                # Read the sensor via the shared helper: one measure()
+                # transaction, F conversion, and timestamp in a single call
+                temperature_c, temperature_f, humidity, timestamp = dht_common.read_dht(dht_sensor)
 
                 # The DHT22 can sometimes return None, especially on startup.
                 if humidity is not None and temperature_c is not None:
-                    # Get the current timestamp
-                    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
                     # Print the readings to the console
                     print(
@@ -108,10 +138,11 @@ def main():
                         f"Humidity: {humidity:.1f}%"
                     )
 
-                    # Append the data to the CSV file
-                    with open(CSV_DIR_FILE_PATH, mode='a', newline='') as file:
-                        writer = csv.writer(file)
-                        writer.writerow([timestamp, f"{temperature_c:.1f}", f"{temperature_f:.1f}", f"{humidity:.1f}"])
+                    # Buffer the row; one writerows + fsync per BATCH_SIZE
+                    # readings amortizes the SD card journal work
+                    batch.append([timestamp, f"{temperature_c:.1f}", f"{temperature_f:.1f}", f"{humidity:.1f}"])
+                    if len(batch) >= BATCH_SIZE:
+                        flush_batch()
 
                 else:
                     print("Sensor read failure. Retrying...")
@@ -121,15 +152,22 @@ def main():
                 print(f"Error reading from sensor: {error.args[0]}")
             except Exception as e:
                 print(f"An unexpected error occurred: {e}")
-            
-            # Wait for the specified interval before the next reading
-            time.sleep(SAMPLE_INTERVAL)
+
+            # Sleep until the next deadline (drift-corrected)
+            next_t += SAMPLE_INTERVAL
+            dt = next_t - time.monotonic()
+            if dt > 0:
+                time.sleep(dt)
+            else:
+                next_t = time.monotonic()  # we fell behind, resync
 
     except KeyboardInterrupt:
         print("\nLogging stopped by user.")
     finally:
-        # Clean up the sensor resources
+        # Flush any buffered rows, then clean up the sensor and file
+        flush_batch()
         dht_sensor.exit()
+        file.close()
         print("Sensor resources released. Exiting.")
 
 
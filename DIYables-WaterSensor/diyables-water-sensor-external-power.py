@@ -24,6 +24,10 @@ from adafruit_ads1x15.analog_in import AnalogIn
 # See the calibration section below.
 WATER_THRESHOLD = 4500  
 
+# Time to wait between readings, in seconds.
+# (same value as DHT22 script)
+SAMPLE_INTERVAL = 3
+
 # --- Setup ---
 
 # Set up the I2C bus
@@ -53,6 +57,11 @@ print("Press Ctrl+C to exit.\n")
 
 # --- Main Loop ---
 
+# Deadline for the next reading - sleeping for the remaining time
+# instead of a fixed 3 s keeps the cadence uniform despite the 100 ms
+# settling wait and the ADS1115 conversion time.
+next_t = time.monotonic()
+
 try:
     while True:
         # Power ON the sensor
@@ -79,9 +88,13 @@ try:
         else:
             print(f"Sensor Value: {raw_value_0} - Dry\n")
         
-        # Wait 3 seconds before the next reading
-        # (same value as DHT22 script)
-        time.sleep(3) 
+        # Sleep until the next deadline (drift-corrected)
+        next_t += SAMPLE_INTERVAL
+        dt = next_t - time.monotonic()
+        if dt > 0:
+            time.sleep(dt)
+        else:
+            next_t = time.monotonic()  # we fell behind, resync
 
 except KeyboardInterrupt:
     print("Script stopped by user.")
@@ -13,6 +13,7 @@ import board
 import busio
 import digitalio
 import adafruit_ads1x15.ads1115 as ADS
+from adafruit_ads1x15.ads1x15 import Mode
 from adafruit_ads1x15.analog_in import AnalogIn
 
 # --- Configuration ---
@@ -28,6 +29,23 @@ WATER_THRESHOLD_LIMIT = 14000
 
 WATER_PRESENCE_RANGE = WATER_THRESHOLD_LIMIT - WATER_THRESHOLD
 
+# Time to wait between readings, in seconds.
+# (same value as DHT22 script)
+SAMPLE_INTERVAL = 3
+
+# Number of ADC samples to average per reading. Samples are spaced one
+# conversion period apart (1/860 s), so a burst of 8 covers 8 distinct
+# conversions in ~10 ms on top of the 100 ms settling wait we already
+# pay, and averaging makes the threshold decision much more noise-robust.
+SAMPLES_PER_READING = 8
+
+# Optional: BCM pin wired to the ADS1115 ALERT/RDY pad. When set, the
+# script arms the chip's comparator and sleeps on a GPIO edge event
+# instead of polling every 3 seconds - zero CPU while dry, and the
+# reaction time drops from up to 3 s to sub-millisecond. Leave as None
+# to keep the plain polling loop (no extra wiring needed).
+ALERT_PIN = None
+
 # --- Setup ---
 
 # Set up the I2C bus
@@ -48,6 +66,13 @@ except ValueError:
 # A3: (ads, 3)
 chan = AnalogIn(ads, 0)
 
+# Continuous-conversion mode at the maximum data rate: each chan.value
+# access then just fetches the latest result over I2C instead of
+# triggering (and waiting out) a fresh single-shot conversion, so a
+# burst of samples costs almost nothing extra.
+ads.mode = Mode.CONTINUOUS
+ads.data_rate = 860
+
 # Setup the sensor power pin as an output
 # sensor_power = digitalio.DigitalInOut(SENSOR_POWER_PIN)
 # sensor_power.direction = digitalio.Direction.OUTPUT
@@ -55,9 +80,89 @@ chan = AnalogIn(ads, 0)
 print("Water sensor test script running.")
 print("Press Ctrl+C to exit.\n")
 
+def read_averaged():
+    """Average SAMPLES_PER_READING independent conversions.
+
+    In continuous mode the conversion register only refreshes every
+    ~1.16 ms (1/860 s); back-to-back I2C reads return faster than that
+    and would mostly re-read the same conversion, so wait one
+    conversion period between samples.
+    """
+    samples = []
+    for _ in range(SAMPLES_PER_READING):
+        samples.append(chan.value)
+        time.sleep(1 / 860)
+    return sum(samples) // len(samples)
+
+# --- Optional event-driven mode ---
+
+def watch_alert(alert_pin):
+    """Block on the ADS1115 ALERT/RDY line instead of polling.
+
+    The ADS1115 comparator asserts ALERT/RDY when a conversion crosses
+    the programmed threshold, and libgpiod turns that edge into a file
+    event the process can sleep on in the kernel (epoll under the
+    hood). Requires the ALERT/RDY pad wired to alert_pin (BCM
+    numbering) and the gpiod >= 2.0 bindings that ship with trixie.
+    """
+    import gpiod
+    from gpiod.line import Bias, Edge
+
+    # Arm the comparator: assert above WATER_THRESHOLD, release 100
+    # counts below it (a little hysteresis so a wet/dry boundary
+    # doesn't chatter). Thresholds use the same raw units as chan.value.
+    ads.comparator_queue_length = 1
+    ads.comparator_low_threshold = WATER_THRESHOLD - 100
+    ads.comparator_high_threshold = WATER_THRESHOLD
+
+    # The mode/data_rate/comparator_queue_length assignments above only
+    # land in the chip's config register when a conversion is requested,
+    # so kick off one read: it writes the config, starts continuous
+    # conversions, and enables the comparator. Without it the ADS1115
+    # stays powered down and ALERT/RDY never asserts.
+    chan.value
+
+    with gpiod.request_lines(
+        "/dev/gpiochip0",
+        consumer="diyables-water-alert",
+        config={
+            # ALERT/RDY is open-drain and active low, hence the pull-up
+            alert_pin: gpiod.LineSettings(
+                edge_detection=Edge.BOTH, bias=Bias.PULL_UP
+            )
+        },
+    ) as request:
+        print(f"Waiting for ALERT/RDY edges on GPIO{alert_pin}...\n")
+        while True:
+            # Sleeps in the kernel until the comparator fires
+            request.wait_edge_events()
+            request.read_edge_events()
+
+            raw_value = read_averaged()
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            print(f"Time: {timestamp}")
+
+            water_presence_percentage = (raw_value - WATER_THRESHOLD) / (WATER_PRESENCE_RANGE) * 100
+
+            if raw_value > WATER_THRESHOLD:
+                print(f"Sensor Value: {raw_value} - WATER DETECTED ({water_presence_percentage:.1f}% presence)\n")
+            else:
+                print(f"Sensor Value: {raw_value} - Dry\n")
+
+
 # --- Main Loop ---
 
+# Deadline for the next reading - sleeping for the remaining time
+# instead of a fixed 3 s keeps the cadence uniform despite the 100 ms
+# settling wait and the ADS1115 conversion time.
+next_t = time.monotonic()
+
 try:
+    # Event-driven path: watch_alert() blocks forever when an
+    # ALERT/RDY pin is configured; otherwise fall through to polling
+    if ALERT_PIN is not None:
+        watch_alert(ALERT_PIN)
+
     while True:
         # Power ON the sensor
         # sensor_power.value = True
@@ -65,9 +170,9 @@ try:
         # Wait a fraction of a second for the sensor to stabilize
         time.sleep(0.1) 
         
-        # Read the raw analog value
+        # Read a short burst of samples and average them
         # The ADS1115 gives a 16-bit value (0-65535)
-        raw_value = chan.value
+        raw_value = read_averaged()
         
         # Power OFF the sensor to prevent corrosion
         # sensor_power.value = False
@@ -85,9 +190,13 @@ try:
         else:
             print(f"Sensor Value: {raw_value} - Dry\n")
         
-        # Wait 3 seconds before the next reading
-        # (same value as DHT22 script)
-        time.sleep(3) 
+        # Sleep until the next deadline (drift-corrected)
+        next_t += SAMPLE_INTERVAL
+        dt = next_t - time.monotonic()
+        if dt > 0:
+            time.sleep(dt)
+        else:
+            next_t = time.monotonic()  # we fell behind, resync
 
 except KeyboardInterrupt:
     print("Script stopped by user.")
@@ -0,0 +1,58 @@
+# shared DHT helpers for the sensor scripts
+
+"""
+Shared DHT sensor helpers.
+
+Importing board + adafruit_dht and constructing the sensor object costs
+a few hundred ms (and a few MB of RSS) on a Pi. get_sensor() caches the
+constructed object, so repeat calls - a supervisor that reloads scripts,
+or anything importing more than one of them - skip the heavy init and
+reuse the existing GPIO state instead of re-building it.
+"""
+
+import functools
+from datetime import datetime
+
+# Celsius -> Fahrenheit scale factor (single multiply per reading)
+C_TO_F_SCALE = 1.8
+
+# Timestamp format shared by the CSV-logging scripts
+TIMESTAMP_FMT = "%Y-%m-%d %H:%M:%S"
+
+
+@functools.lru_cache(maxsize=4)
+def get_sensor(pin_id, kind="DHT22", use_pulseio=False):
+    """Return a cached DHT sensor object for the given pin.
+
+    Args:
+        pin_id: BCM pin number (e.g. 4 for GPIO4)
+        kind: "DHT11" or "DHT22"
+        use_pulseio: passed through to adafruit_dht; False is required on
+            Raspberry Pi 5 / Debian 13 (libgpiod) systems
+    """
+    # Imported here so merely importing this module stays cheap
+    import board
+    import adafruit_dht
+
+    pin = getattr(board, f"D{pin_id}")
+    sensor_cls = getattr(adafruit_dht, kind)
+    return sensor_cls(pin, use_pulseio=use_pulseio)
+
+
+def read_dht(sensor):
+    """Read one sample from a DHT sensor.
+
+    Returns (temp_c, temp_f, humidity, timestamp). Does a single
+    measure() transaction, applies the Fahrenheit conversion, and
+    formats the timestamp once. If the sensor produced no data the
+    first three values are None; a RuntimeError from a failed read is
+    left to the caller, since each script words its retry message
+    differently.
+    """
+    sensor.measure()
+    temperature_c = sensor._temperature
+    humidity = sensor._humidity
+    timestamp = datetime.now().strftime(TIMESTAMP_FMT)
+    if temperature_c is None or humidity is None:
+        return None, None, None, timestamp
+    return temperature_c, temperature_c * C_TO_F_SCALE + 32.0, humidity, timestamp